@@ -1,15 +1,28 @@
 #!/usr/bin/env python3
 
+import io
+import os
+import json
+import atexit
+import queue
+import threading
 import time
 import subprocess as sp
-from csv import writer
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional, Any
-from flask import Flask, jsonify
+from flask import Flask, Response
 from stressmon import CPUInfo, CPUFreq, CPUTemp, CPUUsage, CPUWatts, SysFan, \
                       MemUsage, DriveTemp, GPUData, UpdatePool
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@dataclass(slots=True)
 class OutputData:
     """Data for output updatepool functions"""
     csv_fn: Optional[str] = field(default=None)
@@ -27,27 +40,48 @@ class OutputData:
     data: Optional[list] = field(default=None)
     time: Optional[str] = field(default=None)
     model_name: Optional[str] = field(default=None)
+    _fd: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+_DMI_PRODUCT_VERSION = Path('/sys/class/dmi/id/product_version')
 
+@lru_cache(maxsize=1)
 def get_model_name() -> str:
     """
     Retrieve the model name of the system.
 
-    This function uses the `dmidecode` command to extract the system's model name. 
-    It specifically filters for the 'Version' field from the output of `dmidecode -t 1`, 
-    which contains information about the system's hardware. The command is run with 
-    superuser privileges using `sudo`.
+    This function reads the system's model name from the DMI product version exposed
+    by the kernel at `/sys/class/dmi/id/product_version`. If that file cannot be read
+    or is empty, it falls back to the `dmidecode` command, filtering for the 'Version'
+    field from the output of `dmidecode -t 1` with superuser privileges using `sudo`.
+    Either way only the first word of the version is returned. The model name does
+    not change while the process runs, so the result is cached.
 
     Returns:
         str: The model name of the system.
 
     Raises:
-        subprocess.CalledProcessError: If the command execution fails.
+        subprocess.CalledProcessError: If the fallback command execution fails.
     """
+    try:
+        version = _DMI_PRODUCT_VERSION.read_text(encoding='utf-8').split()
+    except OSError:
+        version = []
+    if version:
+        return version[0]
     return sp.run(["sudo dmidecode -t 1 | grep Version | awk '{print $2}'"],
                   shell=True,
                   check=True,
                   stdout=sp.PIPE).stdout.decode('utf-8').strip()
 
+@lru_cache(maxsize=64)
+def _make_template(widths: tuple, justs: tuple) -> str:
+    """
+    Build the `str.format` template for a line with the given widths and justifications.
+
+    Results are cached, so each distinct column layout is only built once.
+    """
+    return "".join("{:" + just + str(width) + "}" for just, width in zip(justs, widths)) + "\n"
+
 def format_line(items: list, column_widths: list, justifications: list):
     """
     Formats a single line with specified column widths and justifications.
@@ -74,18 +108,191 @@ def format_line(items: list, column_widths: list, justifications: list):
         >>> format_line(items, column_widths, justifications)
         'Name       Age  City           \n'
     """
-    line_format = "".join(
-        ["{:" + just + str(width) + "}" for just, width in zip(justifications, column_widths)]
-    ) + "\n"
-    return line_format.format(*items)
+    return _make_template(tuple(column_widths), tuple(justifications)).format(*items)
+
+CSV_BATCH_ROWS = 64
+CSV_BATCH_BYTES = 128 * 1024
+
+# The row buffer, its byte count and fd, and the set of open fds are shared between
+# the monitor thread and Flask request threads; only touch them with _csv_lock held.
+_csv_buf: list = []
+_csv_buf_bytes = 0
+_csv_buf_fd: Optional[int] = None
+_csv_fds: set = set()
+_csv_lock = threading.Lock()
+_csv_queue: queue.Queue = queue.Queue()
+_csv_writer: Optional[threading.Thread] = None
+_csv_error: Optional[OSError] = None
+_IOV_MAX = os.sysconf('SC_IOV_MAX') if 'SC_IOV_MAX' in os.sysconf_names else 1024
+
+# (version, row) of the latest write_csv call, replaced as a whole on every tick
+_snapshot: tuple = (0, None)
+_snapshot_json = (-1, b'')
+
+app = Flask(__name__)
+
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def jfast(obj: Any) -> Response:
+    """
+    Serialize `obj` into a JSON response.
+
+    Uses `orjson` when it is installed, falling back to the standard library `json`
+    module otherwise.
+
+    Args:
+        obj (Any): The JSON-serializable object to return.
+
+    Returns:
+        Response: A response with an `application/json` body.
+    """
+    return Response(_dumps(obj), mimetype='application/json')
+
+_CSV_SPECIAL = frozenset(',"\r\n')
+_CSV_EOL = "\r\n"
+
+def _fmt(value: Any) -> str:
+    """
+    Format a single CSV field the same way `csv.writer` does with the default dialect.
+
+    None becomes an empty field, numbers use their `str` form, and strings containing
+    a delimiter, quote or line break are quoted with embedded quotes doubled.
+    """
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        value = str(value)
+    if _CSV_SPECIAL.isdisjoint(value):
+        return value
+    return '"' + value.replace('"', '""') + '"'
+
+def _write_rows(fd: int, rows: list) -> None:
+    """
+    Append `rows` to `fd` with vectored `os.writev` calls, retrying after short writes.
+
+    `rows` is consumed: fully written rows are skipped and a partially written row is
+    replaced by its unwritten tail, until every byte has been written.
+    """
+    index = 0
+    while index < len(rows):
+        written = os.writev(fd, rows[index:index + _IOV_MAX])
+        while index < len(rows) and written >= len(rows[index]):
+            written -= len(rows[index])
+            index += 1
+        if written:
+            rows[index] = memoryview(rows[index])[written:]
+
+def _csv_writer_loop() -> None:
+    """
+    Append queued `(fd, rows)` batches to their files with vectored `os.writev` calls.
+
+    Runs on a daemon thread so `write_csv` never blocks on file I/O. A write error is
+    kept and re-raised by the next `write_csv` or `_drain_csv` call.
+    """
+    global _csv_error
+    while True:
+        fd, rows = _csv_queue.get()
+        try:
+            _write_rows(fd, rows)
+        except OSError as err:
+            with _csv_lock:
+                _csv_error = err
+        finally:
+            _csv_queue.task_done()
+
+def _raise_csv_error() -> None:
+    """
+    Re-raise the write error last reported by the writer thread, if any.
+
+    The error is cleared, so each failure is reported once. Must be called with
+    `_csv_lock` held.
+    """
+    global _csv_error
+    if _csv_error is not None:
+        err, _csv_error = _csv_error, None
+        raise err
+
+def _flush_csv_buf() -> int:
+    """
+    Hand any buffered CSV rows to the writer thread as a single batch.
+
+    Must be called with `_csv_lock` held. The writer thread is started on first use.
+
+    Returns:
+        int: The number of rows that were queued.
+    """
+    global _csv_buf, _csv_buf_bytes, _csv_writer
+    rows = len(_csv_buf)
+    if rows:
+        if _csv_writer is None:
+            _csv_writer = threading.Thread(target=_csv_writer_loop, name='csv-writer',
+                                           daemon=True)
+            _csv_writer.start()
+        _csv_queue.put((_csv_buf_fd, _csv_buf))
+        _csv_buf = []
+        _csv_buf_bytes = 0
+    return rows
+
+def _drain_csv() -> int:
+    """
+    Queue any buffered CSV rows and wait until the writer thread has written them.
+
+    Returns:
+        int: The number of rows that were still buffered.
+
+    Raises:
+        OSError: If the writer thread failed to write a batch.
+    """
+    with _csv_lock:
+        rows = _flush_csv_buf()
+    _csv_queue.join()
+    with _csv_lock:
+        _raise_csv_error()
+    return rows
+
+def _close_csv_fds() -> None:
+    """
+    Write any pending CSV rows, then close every descriptor opened by `write_csv`.
+
+    Runs at interpreter exit, when new threads can no longer be started, so rows that
+    never reached the writer thread are written inline instead of being queued.
+    """
+    global _csv_buf, _csv_buf_bytes, _csv_buf_fd
+    _csv_queue.join()
+    with _csv_lock:
+        fd, rows = _csv_buf_fd, _csv_buf
+        _csv_buf = []
+        _csv_buf_bytes = 0
+        _csv_buf_fd = None
+        fds = list(_csv_fds)
+        _csv_fds.clear()
+    try:
+        if rows:
+            _write_rows(fd, rows)
+        with _csv_lock:
+            _raise_csv_error()
+    finally:
+        for open_fd in fds:
+            os.close(open_fd)
+
+atexit.register(_close_csv_fds)
 
 def write_csv(output_data: OutputData) -> None:
     """
     Append current data to a log CSV file.
 
-    This function opens the specified CSV file in append mode and writes the current data
-    to it as a new row. The data is appended to the end of the file without modifying 
-    existing content.
+    The CSV file is opened once in append mode and its descriptor is kept on
+    `output_data`. Each row is pre-formatted into bytes and appended to a module-level
+    buffer, which is handed to a background writer thread once it holds
+    `CSV_BATCH_ROWS` rows or `CSV_BATCH_BYTES` bytes and written with one `os.writev`
+    call. Pending rows are also written by `flush_csv`, the `/flush` endpoint and at
+    interpreter exit. A copy of the row becomes the snapshot served by the `/data`
+    endpoint.
 
     Args:
         output_data (OutputData): An instance of the OutputData class containing the
@@ -97,22 +304,320 @@ def write_csv(output_data: OutputData) -> None:
     Returns:
         None
 
+    Raises:
+        OSError: If the writer thread failed to write an earlier batch. The current
+                 row is not recorded.
+
     Example:
-        >>> class OutputData:
-        >>>     def __init__(self, csv_fn, data):
-        >>>         self.csv_fn = csv_fn
-        >>>         self.data = data
-        >>>
-        >>> output_data = OutputData('log.csv', ['2024-07-30', 'example', 123])
+        >>> output_data = OutputData(csv_fn='log.csv', data=['2024-07-30', 'example', 123])
         >>> write_csv(output_data)
+    """
+    global _csv_buf_bytes, _csv_buf_fd, _snapshot
+    if output_data._fd is None:
+        fd = os.open(output_data.csv_fn, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        with _csv_lock:
+            _csv_fds.add(fd)
+        output_data._fd = fd
+    fields = list(map(_fmt, output_data.data))
+    if len(fields) == 1 and not fields[0]:
+        # csv.writer quotes a lone empty field so the row does not read back as blank
+        fields[0] = '""'
+    row = (",".join(fields) + _CSV_EOL).encode('utf-8')
+    snapshot_row = list(output_data.data)
+    with _csv_lock:
+        _raise_csv_error()
+        if output_data._fd != _csv_buf_fd:
+            _flush_csv_buf()
+            _csv_buf_fd = output_data._fd
+        _csv_buf.append(row)
+        _csv_buf_bytes += len(row)
+        if len(_csv_buf) >= CSV_BATCH_ROWS or _csv_buf_bytes >= CSV_BATCH_BYTES:
+            _flush_csv_buf()
+        _snapshot = (_snapshot[0] + 1, snapshot_row)
+
+def flush_csv(output_data: OutputData) -> None:
+    """
+    Flush appended CSV rows to stable storage.
+
+    Any rows still buffered by `write_csv` are written out first and the writer thread
+    is waited on, then the open descriptor is fsynced. It is called at summary time
+    rather than on every tick.
 
-    Note:
-        Ensure that the `OutputData` class is defined with the appropriate attributes 
-        before using this function.
+    Args:
+        output_data (OutputData): The OutputData instance holding the open CSV file.
+
+    Returns:
+        None
+
+    Raises:
+        OSError: If a buffered batch could not be written.
+    """
+    _drain_csv()
+    if output_data._fd is not None:
+        os.fsync(output_data._fd)
+
+def close_csv(output_data: OutputData) -> None:
+    """
+    Flush and close the CSV file opened for `output_data`.
+
+    Descriptors that are still open at interpreter exit are closed automatically; this
+    releases one earlier, e.g. when an `OutputData` instance is discarded mid-run. A
+    later `write_csv` call reopens the file.
+
+    Args:
+        output_data (OutputData): The OutputData instance holding the open CSV file.
+
+    Returns:
+        None
+
+    Raises:
+        OSError: If a buffered batch could not be written.
+    """
+    global _csv_buf_fd
+    flush_csv(output_data)
+    if output_data._fd is not None:
+        with _csv_lock:
+            if _csv_buf_fd == output_data._fd:
+                _csv_buf_fd = None
+            _csv_fds.discard(output_data._fd)
+        os.close(output_data._fd)
+        output_data._fd = None
+
+@app.route('/flush', methods=['POST'])
+def flush():
+    """
+    Write any buffered CSV rows to disk.
+
+    Intended for the summary path to call before `write_summary` so the log file is
+    complete when the summary is generated.
+
+    Returns:
+        Response: JSON object with the number of rows that were written.
+    """
+    return jfast({"rows": _drain_csv()})
+
+@app.route('/data')
+def data():
+    """
+    Return the most recent row passed to `write_csv`.
+
+    The JSON body is serialized at most once per monitoring tick and reused for
+    every request until `write_csv` records a new row.
+
+    Returns:
+        Response: JSON object with the snapshot `version` and the row as `data`.
+    """
+    global _snapshot_json
+    version, row = _snapshot
+    cached_version, body = _snapshot_json
+    if cached_version != version:
+        body = _dumps({"version": version, "data": row})
+        _snapshot_json = (version, body)
+    return Response(body, mimetype='application/json')
+
+_JUSTS_4 = ('<', '>', '>', '>')
+_JUSTS_5 = ('<', '>', '>', '>', '>')
+_MEM_WIDTHS = (15, 20, 20, 20)
+_CPU_WIDTHS = (15, 15, 15, 15)
+_CTEMPS_WIDTHS = (15, 10, 10, 10)
+_WATTS_WIDTHS = (10, 10, 10, 10)
+_DEVICE_WIDTHS = (15, 15, 15, 15, 15)
+_PCT_MHZ_FMT = "%4s:%5s"
+
+_TMPL_MEM = _make_template(_MEM_WIDTHS, _JUSTS_4)
+_TMPL_CPU = _make_template(_CPU_WIDTHS, _JUSTS_4)
+_TMPL_CTEMPS = _make_template(_CTEMPS_WIDTHS, _JUSTS_4)
+_TMPL_WATTS = _make_template(_WATTS_WIDTHS, _JUSTS_4)
+_TMPL_DEVICE = _make_template(_DEVICE_WIDTHS, _JUSTS_5)
+
+_HDR_CPU = _TMPL_CPU.format("Core", "Min %:Mhz", "Max %:Mhz", "Mean %:Mhz").encode('utf-8')
+_HDR_CTEMPS = _TMPL_CTEMPS.format("Core", "Min C", "Max C", "Mean C").encode('utf-8')
+_HDR_WATTS = _TMPL_WATTS.format("CPU", "Min W", "Max W", "Mean W").encode('utf-8')
+_HDR_FANS = _TMPL_DEVICE.format("Fan", "Current(RPM)", "Min(RPM)", "Max(RPM)",
+                                "Mean(RPM)").encode('utf-8')
+_HDR_DEVICE = _TMPL_DEVICE.format("Data", "Current", "Min", "Max", "Mean").encode('utf-8')
+
+_ENC_SUMMARY = "Summary:\n".encode('utf-8')
+_ENC_MEM_SKUS = "Memory SKUs:\n".encode('utf-8')
+
+def _iter_label_stats(monitor, with_current: bool = False, skip_missing: bool = False):
     """
-    with open(file=output_data.csv_fn, mode='a', encoding='utf-8') as outfile:
-        csv_writer = writer(outfile)
-        csv_writer.writerow(output_data.data)
+    Yield `(params, row)` for every entry of a stressmon monitor.
+
+    `row` is a `(label, min, max, mean)` tuple, or `(label, current, min, max, mean)`
+    when `with_current` is set. With `skip_missing`, entries with no current value
+    yield `None` as their row without querying their statistics. The monitor's getters
+    are looked up once per call rather than once per row.
+    """
+    get_label, get_min = monitor.get_label, monitor.get_min
+    get_max, get_mean = monitor.get_max, monitor.get_mean
+    if with_current:
+        get_current = monitor.get_current
+        for params in monitor:
+            current = get_current(params)
+            if current is None and skip_missing:
+                yield params, None
+            else:
+                yield params, (get_label(params), current, get_min(params),
+                               get_max(params), get_mean(params))
+    else:
+        for params in monitor:
+            yield params, (get_label(params), get_min(params), get_max(params),
+                           get_mean(params))
+
+def _append_section(write, title: str, rows: list, header: Optional[bytes],
+                    template: str) -> None:
+    """
+    Write a titled table section through `write` using a prebuilt line template.
+
+    `write` takes bytes, e.g. the `write` method of a binary file, and `header` is the
+    already encoded column header line. Rows given as a `str` are written verbatim
+    instead of being formatted into columns. The header line is omitted when `header`
+    is None, and nothing is written when `rows` is empty.
+    """
+    if not rows:
+        return
+    if title:
+        write((title + "\n").encode('utf-8'))
+    if header is not None:
+        write(header)
+    for row in rows:
+        if isinstance(row, str):
+            write(row.encode('utf-8'))
+        else:
+            write(template.format(*row).encode('utf-8'))
+    write(b"\n")
+
+def _mem_section(mem: MemUsage) -> bytes:
+    """Render the memory usage tables of the summary, one table per memory type."""
+    buf = io.BytesIO()
+    write = buf.write
+    mem_type = ''
+    mem_data_rows = []
+    header = None
+    for params, row in _iter_label_stats(mem):
+        if mem_type != params[0]:
+            if mem_data_rows:
+                _append_section(write, "", mem_data_rows, header, _TMPL_MEM)
+                mem_data_rows = []
+            mem_type = params[0]
+            header = _TMPL_MEM.format(mem_type, "Min", "Max", "Mean").encode('utf-8')
+        mem_data_rows.append(row)
+    if mem_data_rows:
+        _append_section(write, "", mem_data_rows, header, _TMPL_MEM)
+    return buf.getvalue()
+
+def _cpu_section(mhz: CPUFreq, usage: CPUUsage) -> bytes:
+    """Render the per-core usage and frequency table of the summary."""
+    buf = io.BytesIO()
+    cpu_data_rows = []
+    usage_min, usage_max, usage_mean = usage.get_min, usage.get_max, usage.get_mean
+    for (_, mhz_row), usage_params in zip(_iter_label_stats(mhz), usage):
+        label, mhz_min, mhz_max, mhz_mean = mhz_row
+        cpu_data_rows.append((
+            label,
+            _PCT_MHZ_FMT % (usage_min(usage_params), mhz_min),
+            _PCT_MHZ_FMT % (usage_max(usage_params), mhz_max),
+            _PCT_MHZ_FMT % (usage_mean(usage_params), mhz_mean)
+        ))
+    _append_section(buf.write, "", cpu_data_rows, _HDR_CPU, _TMPL_CPU)
+    return buf.getvalue()
+
+def _ctemps_section(ctemps: CPUTemp) -> bytes:
+    """Render the core temperature table of the summary."""
+    if ctemps.is_empty():
+        return b""
+    buf = io.BytesIO()
+    ctemps_data_rows = [row for _, row in _iter_label_stats(ctemps)]
+    _append_section(buf.write, "", ctemps_data_rows, _HDR_CTEMPS, _TMPL_CTEMPS)
+    return buf.getvalue()
+
+def _watts_section(watts: CPUWatts) -> bytes:
+    """Render the CPU power table of the summary."""
+    if watts.is_empty():
+        return b""
+    buf = io.BytesIO()
+    watts_data_rows = [row for _, row in _iter_label_stats(watts)]
+    _append_section(buf.write, "", watts_data_rows, _HDR_WATTS, _TMPL_WATTS)
+    return buf.getvalue()
+
+def _fans_section(fans: SysFan) -> bytes:
+    """Render the fan speed tables of the summary, one table per fan driver."""
+    if fans.is_empty():
+        return b""
+    buf = io.BytesIO()
+    write = buf.write
+    fan_data_rows = []
+    driver = ''
+    for params, row in _iter_label_stats(fans, with_current=True):
+        if driver != params[0]:
+            if fan_data_rows:
+                _append_section(write, driver, fan_data_rows, _HDR_FANS, _TMPL_DEVICE)
+                fan_data_rows = []
+            driver = params[0]
+        fan_data_rows.append(row)
+    if fan_data_rows:
+        _append_section(write, driver, fan_data_rows, _HDR_FANS, _TMPL_DEVICE)
+    return buf.getvalue()
+
+def _gpus_section(gpus: GPUData) -> bytes:
+    """Render the GPU tables of the summary, one table per GPU vendor."""
+    if gpus.is_empty():
+        return b""
+    buf = io.BytesIO()
+    write = buf.write
+    gpu_data_rows = []
+    current_vendor = ''
+    current_driver_version = ''
+    name = ''
+    get_driver_version = lru_cache(maxsize=1)(gpus.get_driver_version)
+    for params, row in _iter_label_stats(gpus, with_current=True, skip_missing=True):
+        vendor = params[0]
+        if current_vendor != vendor:
+            if gpu_data_rows:
+                _append_section(write, current_vendor + current_driver_version, gpu_data_rows,
+                                _HDR_DEVICE, _TMPL_DEVICE)
+                gpu_data_rows = []
+            current_vendor = vendor
+            current_driver_version = " - " + get_driver_version() if vendor == 'nvidia' else ""
+        if name != params[1]:
+            name = params[1]
+            subsystem = gpus.get_subven(vendor, name)
+            subsystem_info = f"SubSystem: {subsystem}\n" if subsystem else ""
+            gpu_data_rows.append(f"GPU: {name}\n{subsystem_info}")
+        if row is not None:
+            gpu_data_rows.append(row)
+    if gpu_data_rows:
+        _append_section(write, current_vendor + current_driver_version, gpu_data_rows,
+                        _HDR_DEVICE, _TMPL_DEVICE)
+    return buf.getvalue()
+
+def _drives_section(drives: DriveTemp) -> bytes:
+    """Render the drive tables of the summary, one table per device."""
+    if drives.is_empty():
+        return b""
+    buf = io.BytesIO()
+    write = buf.write
+    drive_data_rows = []
+    drive = ''
+    get_model = lru_cache(maxsize=None)(drives.get_model)
+    for params, row in _iter_label_stats(drives, with_current=True, skip_missing=True):
+        if drive != params[0]:
+            if drive_data_rows:
+                _append_section(
+                    write, f"Device: {drive}\nDrive Model: {get_model(drive)}",
+                    drive_data_rows, _HDR_DEVICE, _TMPL_DEVICE
+                )
+                drive_data_rows = []
+            drive = params[0]
+        if row is not None:
+            drive_data_rows.append(row)
+    if drive_data_rows:
+        _append_section(
+            write, f"Device: {drive}\nDrive Model: {get_model(drive)}",
+            drive_data_rows, _HDR_DEVICE, _TMPL_DEVICE
+        )
+    return buf.getvalue()
 
 def write_summary(output_data: OutputData) -> None:
     """
@@ -121,7 +626,9 @@ def write_summary(output_data: OutputData) -> None:
     This function generates a detailed summary of the system's current state, including
     information about the CPU, memory, temperatures, power consumption, fans, GPUs, and
     drives. The summary is formatted into a structured text and written to a specified
-    summary log file.
+    summary log file. The sections are rendered concurrently on a thread pool and
+    written in a fixed order. The file is only opened once every section has been
+    rendered, so an error while gathering data leaves the previous summary intact.
 
     Args:
         output_data (OutputData): An instance of the OutputData class containing various
@@ -144,6 +651,10 @@ def write_summary(output_data: OutputData) -> None:
     Returns:
         None
 
+    Raises:
+        OSError: If buffered CSV rows could not be written. The summary file is still
+                 written before the error is raised.
+
     Example:
         >>> class OutputData:
         >>>     def __init__(self, csv_fn, summary_fn, time, run_time, mhz, ctemps, watts,
@@ -166,162 +677,38 @@ def write_summary(output_data: OutputData) -> None:
         >>>                         mhz, ctemps, watts, fans, gpus, drives, usage, mem, 'Model X')
         >>> write_summary(output_data)
     """
-    def append_formatted_section(title, data_rows, headers, col_widths, justifications):
-        if data_rows:
-            lines.append(title)
-            lines.append(format_line(headers, col_widths, justifications))
-            for row in data_rows:
-                lines.append(format_line(row, col_widths, justifications))
-            lines.append("\n")
+    csv_error = None
+    try:
+        flush_csv(output_data)
+    except OSError as err:
+        csv_error = err
 
     mhz = output_data.mhz
-    ctemps = output_data.ctemps
-    watts = output_data.watts
-    fans = output_data.fans
-    gpus = output_data.gpus
-    drives = output_data.drives
-    usage = output_data.usage
     mem = output_data.mem
     model_name = output_data.model_name
 
-    lines = []
-    lines.append(f"Summary:\nModel: {model_name}\nStart Time: {output_data.time}\n")
-    lines.append(f"Runtime: {output_data.run_time}\nCPU: {mhz.get_model()}\n")
-    lines.append("Memory SKUs:\n")
-    for sku in mem.get_mem_skus():
-        lines.append(f"DIMM: {sku}\n")
-
-    mem_type = ''
-    mem_data_rows = []
-    headers = []
-    column_widths = [15, 20, 20, 20]
-    justifications = ['<', '>', '>', '>']
-    for params in mem:
-        if mem_type != params[0]:
-            if mem_data_rows:
-                append_formatted_section("", mem_data_rows, headers, column_widths, justifications)
-                mem_data_rows = []
-            mem_type = params[0]
-            headers = [mem_type, "Min", "Max", "Mean"]
-        mem_data_rows.append([
-            mem.get_label(params), mem.get_min(params),
-            mem.get_max(params), mem.get_mean(params)
-        ])
-    append_formatted_section("", mem_data_rows, headers, column_widths, justifications)
-
-    cpu_data_rows = []
-    headers = ["Core", "Min %:Mhz", "Max %:Mhz", "Mean %:Mhz"]
-    column_widths = [15, 15, 15, 15]
-    justifications = ['<', '>', '>', '>']
-    for mhz_params, usage_params in zip(mhz, usage):
-        cpu_data_rows.append([
-            mhz.get_label(mhz_params),
-            f"{usage.get_min(usage_params):>4}:{mhz.get_min(mhz_params):>5}",
-            f"{usage.get_max(usage_params):>4}:{mhz.get_max(mhz_params):>5}",
-            f"{usage.get_mean(usage_params):>4}:{mhz.get_mean(mhz_params):>5}"
-        ])
-    append_formatted_section("", cpu_data_rows, headers, column_widths, justifications)
-
-    if not ctemps.is_empty():
-        ctemps_data_rows = []
-        headers = ["Core", "Min C", "Max C", "Mean C"]
-        column_widths = [15, 10, 10, 10]
-        justifications = ['<', '>', '>', '>']
-        for params in ctemps:
-            ctemps_data_rows.append([
-                ctemps.get_label(params), ctemps.get_min(params),
-                ctemps.get_max(params), ctemps.get_mean(params)
-            ])
-        append_formatted_section("", ctemps_data_rows, headers, column_widths, justifications)
-
-    if not watts.is_empty():
-        watts_data_rows = []
-        headers = ["CPU", "Min W", "Max W", "Mean W"]
-        column_widths = [10, 10, 10, 10]
-        justifications = ['<', '>', '>', '>']
-        for params in watts:
-            watts_data_rows.append([
-                watts.get_label(params), watts.get_min(params),
-                watts.get_max(params), watts.get_mean(params)
-            ])
-        append_formatted_section("", watts_data_rows, headers, column_widths, justifications)
-
-    if not fans.is_empty():
-        fan_data_rows = []
-        driver = ''
-        headers = ["Fan", "Current(RPM)", "Min(RPM)", "Max(RPM)", "Mean(RPM)"]
-        column_widths = [15, 15, 15, 15, 15]
-        justifications = ['<', '>', '>', '>', '>']
-        for params in fans:
-            if driver != params[0]:
-                if fan_data_rows:
-                    append_formatted_section(driver, fan_data_rows, headers,
-                                             column_widths, justifications)
-                    fan_data_rows = []
-                driver = params[0]
-            fan_data_rows.append([
-                fans.get_label(params), fans.get_current(params), fans.get_min(params),
-                fans.get_max(params), fans.get_mean(params)
-            ])
-        append_formatted_section(driver, fan_data_rows, headers, column_widths, justifications)
-
-    if not gpus.is_empty():
-        gpu_data_rows = []
-        vendor = ''
-        name = ''
-        headers = ["Data", "Current", "Min", "Max", "Mean"]
-        column_widths = [15, 15, 15, 15, 15]
-        justifications = ['<', '>', '>', '>', '>']
-        for params in gpus:
-            driver_version = ""
-            if vendor != params[0]:
-                if gpu_data_rows:
-                    append_formatted_section(f"{vendor}{driver_version}", gpu_data_rows, headers,
-                                             column_widths, justifications)
-                    gpu_data_rows = []
-                vendor = params[0]
-                if vendor == 'nvidia':
-                    driver_version = " - " + gpus.get_driver_version()
-            if name != params[1]:
-                name = params[1]
-                subsystem = gpus.get_subven(vendor, name)
-                subsystem_info = f"SubSystem: {subsystem}" if subsystem else ""
-                gpu_data_rows.append([
-                    f"GPU: {name}\n{subsystem_info}"
-                ])
-            if gpus.get_current(params) is not None:
-                gpu_data_rows.append([
-                    gpus.get_label(params), gpus.get_current(params), gpus.get_min(params),
-                    gpus.get_max(params), gpus.get_mean(params)
-                ])
-        append_formatted_section(f"{vendor}{driver_version}", gpu_data_rows, headers,
-                                 column_widths, justifications)
-
-    if not drives.is_empty():
-        drive_data_rows = []
-        drive = ''
-        headers = ["Data", "Current", "Min", "Max", "Mean"]
-        column_widths = [15, 15, 15, 15, 15]
-        justifications = ['<', '>', '>', '>', '>']
-        for params in drives:
-            if drive != params[0]:
-                if drive_data_rows:
-                    append_formatted_section(
-                        f"Device: {drive}\nDrive Model: {drives.get_model(drive)}",
-                        drive_data_rows, headers, column_widths, justifications
-                    )
-                    drive_data_rows = []
-                drive = params[0]
-            if drives.get_current(params) is not None:
-                drive_data_rows.append([
-                    drives.get_label(params), drives.get_current(params),
-                    drives.get_min(params), drives.get_max(params),
-                    drives.get_mean(params)
-                ])
-        append_formatted_section(
-            f"Device: {drive}\nDrive Model: {drives.get_model(drive)}",
-            drive_data_rows, headers, column_widths, justifications
-        )
-
-    with open(file=output_data.summary_fn, mode='w', encoding='utf-8') as outfile:
-        outfile.write("".join(lines))
+    header = [
+        _ENC_SUMMARY,
+        f"Model: {model_name}\nStart Time: {output_data.time}\n".encode('utf-8'),
+        f"Runtime: {output_data.run_time}\nCPU: {mhz.get_model()}\n".encode('utf-8'),
+        _ENC_MEM_SKUS,
+    ]
+    header.extend(f"DIMM: {sku}\n".encode('utf-8') for sku in mem.get_mem_skus())
+
+    with ThreadPoolExecutor(max_workers=7) as pool:
+        futures = [
+            pool.submit(_mem_section, mem),
+            pool.submit(_cpu_section, mhz, output_data.usage),
+            pool.submit(_ctemps_section, output_data.ctemps),
+            pool.submit(_watts_section, output_data.watts),
+            pool.submit(_fans_section, output_data.fans),
+            pool.submit(_gpus_section, output_data.gpus),
+            pool.submit(_drives_section, output_data.drives),
+        ]
+        sections = [future.result() for future in futures]
+
+    with open(file=output_data.summary_fn, mode='wb') as outfile:
+        outfile.writelines(header)
+        outfile.writelines(sections)
+    if csv_error is not None:
+        raise csv_error